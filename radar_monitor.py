@@ -5,19 +5,133 @@ Connects to ESP32-C6 via serial and displays radar data with visualization
 
 import sys
 import re
+from collections import deque
+import numpy as np
 import serial
 import serial.tools.list_ports
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QLabel, QComboBox, QPushButton, 
-                              QTextEdit, QGroupBox, QGridLayout, QSplitter)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QBrush
+                              QTextEdit, QPlainTextEdit, QGroupBox, QGridLayout, QSplitter)
+from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QRect, QLine
+from PyQt5.QtGui import (QPainter, QColor, QPen, QFont, QFontMetrics, QBrush, QPixmap,
+                         QStaticText)
 import math
 
 
+# The wire format is 7-bit ASCII, so lines are parsed as bytes and only
+# values that end up in the UI are decoded
+# Config lines are "<name>: <number>[ unit]", keyed by the text before the colon
+_CONFIG_KEYS = {
+    b'Max gate': 'max_gate',
+    b'Max moving gate': 'max_moving_gate',
+    b'Max stationary gate': 'max_stationary_gate',
+    b'Sensor idle time': 'idle_time'
+}
+# Config panel lines, in display order, shown once their key has been received
+_CONFIG_DISPLAY_LINES = (
+    ('firmware', "Firmware: {firmware}\n"),
+    ('max_gate', "Max Gate: {max_gate}\n"),
+    ('max_moving_gate', "Max Moving Gate: {max_moving_gate}\n"),
+    ('max_stationary_gate', "Max Stationary Gate: {max_stationary_gate}\n"),
+    ('idle_time', "Idle Time: {idle_time} seconds\n")
+)
+_CONFIG_HEADER = "SENSOR CONFIGURATION\n" + "="*40 + "\n"
+# Precompiled line patterns (compiled once instead of per incoming line)
+# Format: "Presence: YES | Stationary: 38cm E:100 | Moving: 30cm E:100"
+# Either target section may be missing, so both are optional groups
+_DETECT_RE = re.compile(rb"Presence:\s*(YES|NO)"
+                        rb"(?:.*?Stationary:\s*(\d+)cm\s*E:(\d+))?"
+                        rb"(?:.*?Moving:\s*(\d+)cm\s*E:(\d+))?")
+# Format: "GATES_MOV:0,1,2,3,4,5,6,7,8 | GATES_STAT:0,1,2,3,4,5,6,7,8"
+_GATE_RE = re.compile(rb"GATES_MOV:([\d,]+)(?:\s*\|\s*GATES_STAT:([\d,]+))?")
+
+
+def _parse_gate_values(csv):
+    """Parse a 9-value gate CSV into an int16 array, returning None if it is malformed"""
+    if csv is None:
+        return None
+    try:
+        values = np.fromstring(csv, dtype=np.int16, sep=',')
+    except ValueError:
+        # [\d,]+ still admits empty fields such as b"1,,2" or b",1"
+        return None
+    return values if len(values) == 9 else None
+
+
+def _parse_gates(line):
+    match = _GATE_RE.match(line)
+    if not match:
+        return None
+    return {'type': 'gates',
+            'moving': _parse_gate_values(match.group(1)),
+            'stationary': _parse_gate_values(match.group(2))}
+
+
+def _parse_detection(line):
+    match = _DETECT_RE.match(line)
+    if not match:
+        return None
+    presence, stat_dist, stat_energy, mov_dist, mov_energy = match.groups()
+    return {'type': 'detect', 'presence': presence == b'YES',
+            'stat_dist': int(stat_dist or 0), 'stat_energy': int(stat_energy or 0),
+            'mov_dist': int(mov_dist or 0), 'mov_energy': int(mov_energy or 0)}
+
+
+# Data lines keyed by the text before the first colon
+_LINE_PARSERS = {
+    b'GATES_MOV': _parse_gates,
+    b'Presence': _parse_detection
+}
+
+
+def parse_line(line):
+    """Parse one raw (bytes) serial line into a message dict, or None if it carries no data"""
+    key, sep, rest = line.partition(b':')
+    if not sep:
+        return None
+    
+    parser = _LINE_PARSERS.get(key)
+    if parser is not None:
+        return parser(line)
+    
+    config_key = _CONFIG_KEYS.get(key)
+    if config_key is not None:
+        # Value is the leading number; anything after it is a unit
+        parts = rest.split(None, 1)
+        if parts and parts[0].isdigit():
+            return {'type': 'config', 'key': config_key, 'value': parts[0].decode('ascii')}
+        return None
+    
+    if b"firmware version:" in line or b"Version:" in line:
+        return {'type': 'config', 'key': 'firmware',
+                'value': line.split(b':')[1].strip().decode('utf-8', errors='ignore')}
+    
+    return None
+
+
+def _device_size(widget):
+    """Widget size in device pixels, i.e. scaled by the screen's pixel ratio"""
+    return widget.size() * widget.devicePixelRatioF()
+
+
+def _device_pixmap(widget):
+    """Allocate a pixmap that covers the widget sharply on high-DPI screens"""
+    pixmap = QPixmap(_device_size(widget))
+    pixmap.setDevicePixelRatio(widget.devicePixelRatioF())
+    return pixmap
+
+
+def _static_text(text):
+    """Build a plain-text QStaticText so its layout is reused across paints"""
+    static = QStaticText(text)
+    static.setTextFormat(Qt.PlainText)
+    return static
+
+
 class SerialReader(QThread):
-    """Thread for reading serial data"""
-    data_received = pyqtSignal(str)
+    """Thread for reading and parsing serial data"""
+    parsed = pyqtSignal(dict)
+    log_line = pyqtSignal(str)
     
     def __init__(self, port, baudrate=115200):
         super().__init__()
@@ -25,24 +139,54 @@ class SerialReader(QThread):
         self.baudrate = baudrate
         self.running = False
         self.serial_conn = None
+        # Set by stop(); unlike running, run() never overwrites it, so a stop
+        # requested while the port is still opening is not lost
+        self._stop_requested = False
         
     def run(self):
         try:
-            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=1)
+            # Short timeout so the blocking single-byte read below unblocks quickly
+            self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=0.05)
+            if self._stop_requested:
+                self.serial_conn.close()
+                return
             self.running = True
+            buf = bytearray()
             
-            while self.running:
-                if self.serial_conn.in_waiting:
+            while self.running and not self._stop_requested:
+                # Port-level failures (e.g. the cable was unplugged) propagate to the
+                # outer handler and end the thread instead of repeating every pass
+                n = self.serial_conn.in_waiting
+                chunk = self.serial_conn.read(n if n else 1)
+                if not chunk:
+                    continue
+                buf.extend(chunk)
+                while b'\n' in buf:
+                    raw, _, buf = buf.partition(b'\n')
+                    line = bytes(raw).strip()
+                    if not line:
+                        continue
                     try:
-                        line = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
-                        if line:
-                            self.data_received.emit(line)
+                        # Gate lines dominate the volume and are already visualized,
+                        # so they are never decoded for the log
+                        if not line.startswith(b'GATES_MOV:'):
+                            self.log_line.emit(line.decode('utf-8', errors='ignore'))
+                        msg = parse_line(line)
+                        if msg is not None:
+                            self.parsed.emit(msg)
                     except Exception as e:
-                        self.data_received.emit(f"Read error: {e}")
+                        self.log_line.emit(f"Read error: {e}")
         except Exception as e:
-            self.data_received.emit(f"Serial error: {e}")
+            # stop() closes the port under a blocked read; that is not an error
+            if not self._stop_requested:
+                self.log_line.emit(f"Serial error: {e}")
+        finally:
+            self.running = False
+            if self.serial_conn and self.serial_conn.is_open:
+                self.serial_conn.close()
             
     def stop(self):
+        self._stop_requested = True
         self.running = False
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
@@ -53,90 +197,189 @@ class GateEnergyWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.moving_energy = [0] * 9
-        self.stationary_energy = [0] * 9
+        self.moving_energy = np.zeros(9, dtype=np.int16)
+        self.stationary_energy = np.zeros(9, dtype=np.int16)
         self.setMinimumSize(600, 350)
         self.setSizePolicy(self.sizePolicy().Expanding, self.sizePolicy().Expanding)
+        # paintEvent always covers the whole widget with the background pixmap,
+        # so Qt does not need to erase it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        
+        # Paint resources, created once instead of on every paintEvent
+        self._bg_color = QColor(20, 20, 30)
+        self._text_pen = QPen(QColor(255, 255, 255))
+        self._grid_pen = QPen(QColor(60, 60, 80), 1)
+        self._grid_label_pen = QPen(QColor(100, 100, 120))
+        self._axis_pen = QPen(QColor(150, 150, 170), 2)
+        self._gate_label_pen = QPen(QColor(200, 200, 220))
+        self._stat_brush = QBrush(QColor(100, 150, 255))
+        self._mov_brush = QBrush(QColor(255, 100, 100))
+        self._title_font = QFont('Arial', 12, QFont.Bold)
+        self._gate_font = QFont('Arial', 10, QFont.Bold)
+        self._legend_font = QFont('Arial', 9)
+        self._small_font = QFont('Arial', 8)
+        
+        # Fixed labels, shaped once; drawStaticText positions by top edge, so keep ascents
+        self._gate_labels = [_static_text(f"G{i}") for i in range(9)]
+        self._dist_labels = [_static_text(f"{i * 75}cm") for i in range(9)]
+        self._grid_labels = {i: _static_text(str(i)) for i in range(0, 101, 20)}
+        self._gate_ascent = QFontMetrics(self._gate_font).ascent()
+        self._small_ascent = QFontMetrics(self._small_font).ascent()
+        
+        self._bg_pixmap = None
+        self._update_layout()
         
     def update_data(self, moving, stationary):
+        # Arrays are shared with the owner and updated in place, not copied
         self.moving_energy = moving
         self.stationary_energy = stationary
         self.update()
         
+    def _update_layout(self):
+        """Recompute the section rectangles for the current widget size"""
+        width = self.width()
+        height = self.height()
+        
+        # Graph area with more bottom margin for labels
+        self._graph_x = 50
+        self._graph_y = 50
+        self._graph_width = width - 100
+        self._graph_height = height - 100
+        
+        self._title_rect = QRect(0, 0, width, 35)
+        # Grid, axes and the value labels to the left of the y axis
+        self._grid_rect = QRect(self._graph_x - 30, self._graph_y - 10,
+                                self._graph_width + 30, self._graph_height + 20)
+        self._bars_rect = QRect(self._graph_x, self._graph_y,
+                                self._graph_width, self._graph_height)
+        
+        # Bar geometry only changes with the size; paint just needs the heights
+        self._bar_width = self._graph_width // 20
+        self._bar_base = self._graph_y + self._graph_height
+        gate_spacing = self._graph_width // 9
+        centers = [self._graph_x + (i * gate_spacing) + gate_spacing // 2 for i in range(9)]
+        self._stat_bar_x = [x - self._bar_width - 2 for x in centers]
+        self._mov_bar_x = [x + 2 for x in centers]
+        
+        # Grid and axis lines, stroked with a single drawLines call each
+        graph_right = self._graph_x + self._graph_width
+        self._grid_y = {i: self._bar_base - (i * self._graph_height // 100)
+                        for i in range(0, 101, 20)}
+        self._grid_lines = [QLine(self._graph_x, y, graph_right, y) for y in self._grid_y.values()]
+        self._axis_lines = [QLine(self._graph_x, self._graph_y, self._graph_x, self._bar_base),
+                            QLine(self._graph_x, self._bar_base, graph_right, self._bar_base)]
+        self._legend_rect = QRect(width - 180, 10, 100, 40)
+        
+    def _render_background(self):
+        """Render everything that only depends on the widget size into a pixmap"""
+        self._bg_pixmap = _device_pixmap(self)
+        self._bg_pixmap.fill(self._bg_color)
+        
+        painter = QPainter(self._bg_pixmap)
+        rect = self.rect()
+        self._paint_background(painter, rect)
+        self._paint_gate_labels(painter)
+        self._paint_legend(painter, rect)
+        painter.end()
+        
+    def resizeEvent(self, event):
+        self._update_layout()
+        self._render_background()
+        super().resizeEvent(event)
+        
     def paintEvent(self, event):
+        rect = event.rect()
+        if not rect.intersects(self.rect()):
+            return
+        
+        if self._bg_pixmap is None or self._bg_pixmap.size() != _device_size(self):
+            self._render_background()
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         
-        width = self.width()
-        height = self.height()
+        # Static scaffold in a single blit, then only the bars on top
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        self._paint_bars(painter, rect)
         
-        # Background
-        painter.fillRect(0, 0, width, height, QColor(20, 20, 30))
+    def _paint_background(self, painter, rect):
+        # Background (only the exposed part)
+        painter.fillRect(rect, self._bg_color)
         
         # Title
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont('Arial', 12, QFont.Bold))
-        painter.drawText(10, 25, "Gate Energy Levels (0-8 gates, ~75cm per gate)")
+        if rect.intersects(self._title_rect):
+            painter.setPen(self._text_pen)
+            painter.setFont(self._title_font)
+            painter.drawText(10, 25, "Gate Energy Levels (0-8 gates, ~75cm per gate)")
         
-        # Graph area with more bottom margin for labels
-        graph_x = 50
-        graph_y = 50
-        graph_width = width - 100
-        graph_height = height - 100
+        if not rect.intersects(self._grid_rect):
+            return
         
         # Draw grid lines
-        painter.setPen(QPen(QColor(60, 60, 80), 1))
-        for i in range(0, 101, 20):
-            y = graph_y + graph_height - (i * graph_height // 100)
-            painter.drawLine(graph_x, y, graph_x + graph_width, y)
-            painter.setPen(QColor(100, 100, 120))
-            painter.setFont(QFont('Arial', 8))
-            painter.drawText(graph_x - 30, y + 4, f"{i}")
-            painter.setPen(QPen(QColor(60, 60, 80), 1))
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
+        
+        # Grid value labels
+        painter.setPen(self._grid_label_pen)
+        painter.setFont(self._small_font)
+        label_x = self._graph_x - 30
+        for i, y in self._grid_y.items():
+            painter.drawStaticText(label_x, y + 4 - self._small_ascent, self._grid_labels[i])
         
         # Draw axes
-        painter.setPen(QPen(QColor(150, 150, 170), 2))
-        painter.drawLine(graph_x, graph_y, graph_x, graph_y + graph_height)
-        painter.drawLine(graph_x, graph_y + graph_height, graph_x + graph_width, graph_y + graph_height)
+        painter.setPen(self._axis_pen)
+        painter.drawLines(self._axis_lines)
         
-        # Bar width
-        bar_width = graph_width // 20
-        gate_spacing = graph_width // 9
+    def _paint_gate_labels(self, painter):
+        graph_x = self._graph_x
+        label_y = self._graph_y + self._graph_height
+        gate_spacing = self._graph_width // 9
         
-        # Draw bars for each gate
+        painter.setPen(self._gate_label_pen)
         for i in range(9):
             x = graph_x + (i * gate_spacing) + gate_spacing // 2
             
-            # Stationary (blue)
-            stat_val = self.stationary_energy[i]
-            stat_height = int((stat_val / 100.0) * graph_height)
-            painter.fillRect(x - bar_width - 2, graph_y + graph_height - stat_height,
-                           bar_width, stat_height, QColor(100, 150, 255))
-            
-            # Moving (red)
-            mov_val = self.moving_energy[i]
-            mov_height = int((mov_val / 100.0) * graph_height)
-            painter.fillRect(x + 2, graph_y + graph_height - mov_height,
-                           bar_width, mov_height, QColor(255, 100, 100))
-            
             # Gate label
-            painter.setPen(QColor(200, 200, 220))
-            painter.setFont(QFont('Arial', 10, QFont.Bold))
-            painter.drawText(x - 10, graph_y + graph_height + 20, f"G{i}")
+            painter.setFont(self._gate_font)
+            painter.drawStaticText(x - 10, label_y + 20 - self._gate_ascent, self._gate_labels[i])
             
             # Distance label (~75cm per gate)
-            distance_cm = i * 75
-            painter.setFont(QFont('Arial', 8))
-            painter.drawText(x - 18, graph_y + graph_height + 38, f"{distance_cm}cm")
-        
-        # Legend
-        painter.fillRect(width - 180, 10, 15, 15, QColor(100, 150, 255))
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont('Arial', 9))
-        painter.drawText(width - 160, 22, "Stationary")
-        
-        painter.fillRect(width - 180, 30, 15, 15, QColor(255, 100, 100))
-        painter.drawText(width - 160, 42, "Moving")
+            painter.setFont(self._small_font)
+            painter.drawStaticText(x - 18, label_y + 38 - self._small_ascent, self._dist_labels[i])
+        
+    def _paint_bars(self, painter, rect):
+        if not rect.intersects(self._bars_rect):
+            return
+        
+        # Bar heights for all gates in one pass
+        graph_height = self._graph_height
+        stat_heights = (self.stationary_energy.astype(np.int32) * graph_height // 100).tolist()
+        mov_heights = (self.moving_energy.astype(np.int32) * graph_height // 100).tolist()
+        
+        bar_width = self._bar_width
+        base = self._bar_base
+        stat_brush = self._stat_brush
+        mov_brush = self._mov_brush
+        
+        # Stationary (blue) and moving (red) bars for each gate
+        for stat_x, mov_x, stat_height, mov_height in zip(
+                self._stat_bar_x, self._mov_bar_x, stat_heights, mov_heights):
+            painter.fillRect(stat_x, base - stat_height, bar_width, stat_height, stat_brush)
+            painter.fillRect(mov_x, base - mov_height, bar_width, mov_height, mov_brush)
+        
+    def _paint_legend(self, painter, rect):
+        if not rect.intersects(self._legend_rect):
+            return
+        
+        left = self._legend_rect.left()
+        top = self._legend_rect.top()
+        painter.fillRect(left, top, 15, 15, self._stat_brush)
+        painter.setPen(self._text_pen)
+        painter.setFont(self._legend_font)
+        painter.drawText(left + 20, top + 12, "Stationary")
+        
+        painter.fillRect(left, top + 20, 15, 15, self._mov_brush)
+        painter.drawText(left + 20, top + 32, "Moving")
 
 
 class RadarWidget(QWidget):
@@ -151,6 +394,47 @@ class RadarWidget(QWidget):
         self.presence = False
         self.setMinimumSize(500, 400)
         self.setSizePolicy(self.sizePolicy().Expanding, self.sizePolicy().Expanding)
+        # paintEvent always covers the whole widget with the background pixmap,
+        # so Qt does not need to erase it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        
+        # Paint resources, created once instead of on every paintEvent
+        self._bg_color = QColor(20, 20, 30)
+        self._grid_pen = QPen(QColor(60, 60, 80), 1)
+        self._range_label_pen = QPen(QColor(100, 100, 120))
+        self._angle_label_pen = QPen(QColor(150, 150, 170))
+        self._coverage_brush = QBrush(QColor(30, 40, 60, 50))
+        self._stat_brush = QBrush(QColor(100, 150, 255, 150))
+        self._stat_pen = QPen(QColor(100, 150, 255), 3)
+        self._stat_label_pen = QPen(QColor(150, 200, 255))
+        self._mov_brush = QBrush(QColor(255, 100, 100, 150))
+        self._mov_pen = QPen(QColor(255, 100, 100), 3)
+        self._mov_label_pen = QPen(QColor(255, 150, 150))
+        self._sensor_brush = QBrush(QColor(0, 255, 0))
+        self._detected_pen = QPen(QColor(0, 255, 0))
+        self._idle_pen = QPen(QColor(150, 150, 150))
+        self._small_font = QFont('Arial', 8)
+        self._angle_font = QFont('Arial', 9)
+        self._target_font = QFont('Arial', 10, QFont.Bold)
+        self._status_font = QFont('Arial', 12, QFont.Bold)
+        
+        # Fixed angles, so their trig values are computed once
+        self._angle_sincos = [(math.sin(math.radians(a)), math.cos(math.radians(a)))
+                              for a in (-60, -30, 0, 30, 60)]
+        self._label_angle_sincos = (math.sin(math.radians(60)), math.cos(math.radians(60)))
+        
+        # Fixed labels, shaped once; drawStaticText positions by top edge, so keep ascents
+        self._range_labels = {d: _static_text(f"{d}cm") for d in range(100, 601, 100)}
+        self._angle_labels = [_static_text(t) for t in ("-60°", "0°", "+60°")]
+        self._detected_text = _static_text("TARGET DETECTED")
+        self._idle_text = _static_text("NO TARGET")
+        self._small_ascent = QFontMetrics(self._small_font).ascent()
+        self._angle_ascent = QFontMetrics(self._angle_font).ascent()
+        self._status_ascent = QFontMetrics(self._status_font).ascent()
+        
+        self._bg_pixmap = None
+        self._update_layout()
         
     def update_data(self, presence, stat_dist, stat_energy, mov_dist, mov_energy):
         self.presence = presence
@@ -160,113 +444,167 @@ class RadarWidget(QWidget):
         self.moving_energy = mov_energy
         self.update()
         
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Get widget dimensions
+    def _update_layout(self):
+        """Recompute radar geometry and section rectangles for the current size"""
         width = self.width()
         height = self.height()
         
         # Radar origin (bottom center)
-        origin_x = width // 2
-        origin_y = height - 50
+        self._origin_x = width // 2
+        self._origin_y = height - 50
         
         # Max range in cm (6 meters = 600 cm)
-        max_range = 600
-        scale = (height - 100) / max_range
+        self._max_range = 600
+        self._max_radius = height - 100
+        self._scale = self._max_radius / self._max_range
+        
+        # Targets, their labels and the sensor dot stay within the scope's columns
+        self._scope_rect = QRect(self._origin_x - self._max_radius, 0,
+                                 self._max_radius * 2, self._origin_y + 10)
+        self._status_rect = QRect(0, 0, 220, 40)
+        
+        # Angle lines (every 30°) from the origin, stroked with one drawLines call
+        self._angle_lines = [QLine(self._origin_x, self._origin_y,
+                                   self._origin_x + int(self._max_radius * sin_a),
+                                   self._origin_y - int(self._max_radius * cos_a))
+                             for sin_a, cos_a in self._angle_sincos]
+        
+    def _render_background(self):
+        """Render the static scaffold (arcs, angle lines, coverage, labels) into a pixmap"""
+        self._bg_pixmap = _device_pixmap(self)
+        self._bg_pixmap.fill(self._bg_color)
+        
+        painter = QPainter(self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_background(painter)
+        painter.end()
+        
+    def resizeEvent(self, event):
+        self._update_layout()
+        self._render_background()
+        super().resizeEvent(event)
+        
+    def paintEvent(self, event):
+        rect = event.rect()
+        if not rect.intersects(self.rect()):
+            return
+        
+        if self._bg_pixmap is None or self._bg_pixmap.size() != _device_size(self):
+            self._render_background()
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Static scaffold in a single blit, then only the dynamic parts on top
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        self._paint_targets(painter, rect)
+        self._paint_status(painter, rect)
         
-        # Draw background
-        painter.fillRect(0, 0, width, height, QColor(20, 20, 30))
+    def _paint_background(self, painter):
+        origin_x = self._origin_x
+        origin_y = self._origin_y
+        max_radius = self._max_radius
         
         # Draw range arcs (every 100cm)
-        painter.setPen(QPen(QColor(60, 60, 80), 1))
-        for distance in range(100, max_range + 1, 100):
-            radius = int(distance * scale)
+        label_sin, label_cos = self._label_angle_sincos
+        painter.setPen(self._grid_pen)
+        painter.setFont(self._small_font)
+        for distance in range(100, self._max_range + 1, 100):
+            radius = int(distance * self._scale)
             # Draw arc from -60° to +60° (120° total)
             painter.drawArc(origin_x - radius, origin_y - radius, 
                           radius * 2, radius * 2, 
                           30 * 16, 120 * 16)  # Qt uses 1/16th degree units
             
             # Draw distance labels
-            painter.setPen(QColor(100, 100, 120))
-            painter.setFont(QFont('Arial', 8))
-            label_x = origin_x + int(radius * math.cos(math.radians(60)))
-            label_y = origin_y - int(radius * math.sin(math.radians(60)))
-            painter.drawText(label_x + 5, label_y, f"{distance}cm")
+            painter.setPen(self._range_label_pen)
+            label_x = origin_x + int(radius * label_cos)
+            label_y = origin_y - int(radius * label_sin)
+            painter.drawStaticText(label_x + 5, label_y - self._small_ascent,
+                                   self._range_labels[distance])
         
         # Draw angle lines (every 30°)
-        painter.setPen(QPen(QColor(60, 60, 80), 1))
-        for angle in [-60, -30, 0, 30, 60]:
-            rad = math.radians(angle)
-            end_x = origin_x + int((height - 100) * math.sin(rad))
-            end_y = origin_y - int((height - 100) * math.cos(rad))
-            painter.drawLine(origin_x, origin_y, end_x, end_y)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._angle_lines)
         
         # Draw coverage area fill
-        painter.setBrush(QBrush(QColor(30, 40, 60, 50)))
+        painter.setBrush(self._coverage_brush)
         painter.setPen(Qt.NoPen)
-        painter.drawPie(origin_x - (height - 100), origin_y - (height - 100),
-                       (height - 100) * 2, (height - 100) * 2,
+        painter.drawPie(origin_x - max_radius, origin_y - max_radius,
+                       max_radius * 2, max_radius * 2,
                        30 * 16, 120 * 16)
         
+        # Draw angle labels
+        width = self.width()
+        height = self.height()
+        painter.setPen(self._angle_label_pen)
+        painter.setFont(self._angle_font)
+        label_y = height - 20 - self._angle_ascent
+        left_label, center_label, right_label = self._angle_labels
+        painter.drawStaticText(20, label_y, left_label)
+        painter.drawStaticText(width // 2 - 10, label_y, center_label)
+        painter.drawStaticText(width - 50, label_y, right_label)
+        
+    def _paint_targets(self, painter, rect):
+        if not rect.intersects(self._scope_rect):
+            return
+        
+        origin_x = self._origin_x
+        origin_y = self._origin_y
+        
         # Draw stationary target
+        painter.setFont(self._target_font)
         if self.presence and self.stationary_distance > 0:
-            radius = int(self.stationary_distance * scale)
+            radius = int(self.stationary_distance * self._scale)
             # Draw as a blue arc
-            painter.setBrush(QBrush(QColor(100, 150, 255, 150)))
-            painter.setPen(QPen(QColor(100, 150, 255), 3))
+            painter.setBrush(self._stat_brush)
+            painter.setPen(self._stat_pen)
             painter.drawPie(origin_x - radius, origin_y - radius,
                            radius * 2, radius * 2,
                            30 * 16, 120 * 16)
             
             # Label
-            painter.setPen(QColor(150, 200, 255))
-            painter.setFont(QFont('Arial', 10, QFont.Bold))
+            painter.setPen(self._stat_label_pen)
             painter.drawText(origin_x - 50, origin_y - radius - 10,
                            f"Stationary: {self.stationary_distance}cm")
         
         # Draw moving target
         if self.presence and self.moving_distance > 0:
-            radius = int(self.moving_distance * scale)
+            radius = int(self.moving_distance * self._scale)
             # Draw as a red arc
-            painter.setBrush(QBrush(QColor(255, 100, 100, 150)))
-            painter.setPen(QPen(QColor(255, 100, 100), 3))
+            painter.setBrush(self._mov_brush)
+            painter.setPen(self._mov_pen)
             painter.drawPie(origin_x - radius, origin_y - radius,
                            radius * 2, radius * 2,
                            30 * 16, 120 * 16)
             
             # Label
-            painter.setPen(QColor(255, 150, 150))
-            painter.setFont(QFont('Arial', 10, QFont.Bold))
+            painter.setPen(self._mov_label_pen)
             painter.drawText(origin_x + 10, origin_y - radius - 10,
                            f"Moving: {self.moving_distance}cm")
         
         # Draw radar sensor at origin
-        painter.setBrush(QBrush(QColor(0, 255, 0)))
+        painter.setBrush(self._sensor_brush)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(origin_x - 5, origin_y - 5, 10, 10)
         
-        # Draw status text
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont('Arial', 12, QFont.Bold))
-        status = "TARGET DETECTED" if self.presence else "NO TARGET"
-        color = QColor(0, 255, 0) if self.presence else QColor(150, 150, 150)
-        painter.setPen(color)
-        painter.drawText(10, 30, status)
+    def _paint_status(self, painter, rect):
+        if not rect.intersects(self._status_rect):
+            return
         
-        # Draw angle labels
-        painter.setPen(QColor(150, 150, 170))
-        painter.setFont(QFont('Arial', 9))
-        painter.drawText(20, height - 20, "-60°")
-        painter.drawText(width // 2 - 10, height - 20, "0°")
-        painter.drawText(width - 50, height - 20, "+60°")
+        # Draw status text
+        painter.setFont(self._status_font)
+        status = self._detected_text if self.presence else self._idle_text
+        painter.setPen(self._detected_pen if self.presence else self._idle_pen)
+        painter.drawStaticText(10, 30 - self._status_ascent, status)
 
 
 class RadarMonitor(QMainWindow):
     def __init__(self):
         super().__init__()
         self.serial_thread = None
+        # Readers that were stopped but had not finished within the retire timeout
+        self._retired_threads = []
         self.config_data = {}
         self.current_data = {
             'presence': False,
@@ -276,12 +614,33 @@ class RadarMonitor(QMainWindow):
             'mov_energy': 0
         }
         self.gate_data = {
-            'moving': [0] * 9,
-            'stationary': [0] * 9
+            'moving': np.zeros(9, dtype=np.int16),
+            'stationary': np.zeros(9, dtype=np.int16)
         }
+        self._handlers = {
+            'config': self.handle_config,
+            'detect': self.handle_detection,
+            'gates': self.handle_gate_data
+        }
+        self._log_buffer = deque(maxlen=500)
+        self._dirty = False
+        self._gates_dirty = False
+        self._config_dirty = False
+        # Last value shown per status label, so unchanged labels are not touched
+        self._last_shown = {}
         
         self.init_ui()
         
+        # Handlers only update state; widgets are refreshed at most ~30 times/s
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.timeout.connect(self._flush_state)
+        self._repaint_timer.start(33)
+        
+        # Coalesce log lines from the serial thread into one append per tick
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self.flush_log)
+        self._log_timer.start(100)
+        
     def init_ui(self):
         self.setWindowTitle('LD2410C Radar Monitor')
         self.setGeometry(100, 100, 1400, 900)
@@ -332,6 +691,7 @@ class RadarMonitor(QMainWindow):
         gate_group.setLayout(gate_layout)
         
         self.gate_widget = GateEnergyWidget()
+        self.gate_widget.update_data(self.gate_data['moving'], self.gate_data['stationary'])
         gate_layout.addWidget(self.gate_widget)
         
         left_layout.addWidget(gate_group, stretch=1)
@@ -385,9 +745,10 @@ class RadarMonitor(QMainWindow):
         log_layout = QVBoxLayout()
         log_group.setLayout(log_layout)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        # setMaximumBlockCount doesn't exist in QTextEdit, we'll manage size manually
+        # Oldest lines are trimmed automatically once the limit is reached
+        self.log_text.setMaximumBlockCount(500)
         log_layout.addWidget(self.log_text)
         
         clear_log_btn = QPushButton("Clear Log")
@@ -417,96 +778,85 @@ class RadarMonitor(QMainWindow):
             port_text = self.port_combo.currentText()
             if port_text:
                 port = port_text.split(' - ')[0]
+                # A previous reader may still be starting up or shutting down
+                if self.serial_thread is not None:
+                    self._retire_serial_thread()
                 self.serial_thread = SerialReader(port)
-                self.serial_thread.data_received.connect(self.process_serial_data)
+                self.serial_thread.parsed.connect(self.process_serial_data)
+                self.serial_thread.log_line.connect(self.queue_log_line)
                 self.serial_thread.start()
                 self.connect_btn.setText("Disconnect")
-                self.log_text.append(f"Connected to {port}")
+                self.log_text.appendPlainText(f"Connected to {port}")
         else:
             # Disconnect
             self.serial_thread.stop()
             self.serial_thread.wait()
             self.connect_btn.setText("Connect")
-            self.log_text.append("Disconnected")
+            self.log_text.appendPlainText("Disconnected")
             
-    def process_serial_data(self, line):
-        # Add to log
-        self.log_text.append(line)
-        
-        # Parse configuration data
-        if "Max gate:" in line:
-            match = re.search(r"Max gate:\s*(\d+)", line)
-            if match:
-                self.config_data['max_gate'] = match.group(1)
-                self.update_config_display()
-        elif "Max moving gate:" in line:
-            match = re.search(r"Max moving gate:\s*(\d+)", line)
-            if match:
-                self.config_data['max_moving_gate'] = match.group(1)
-                self.update_config_display()
-        elif "Max stationary gate:" in line:
-            match = re.search(r"Max stationary gate:\s*(\d+)", line)
-            if match:
-                self.config_data['max_stationary_gate'] = match.group(1)
-                self.update_config_display()
-        elif "Sensor idle time:" in line:
-            match = re.search(r"Sensor idle time:\s*(\d+)", line)
-            if match:
-                self.config_data['idle_time'] = match.group(1)
-                self.update_config_display()
-        elif "firmware version:" in line or "Version:" in line:
-            self.config_data['firmware'] = line.split(':')[1].strip()
-            self.update_config_display()
+    def _retire_serial_thread(self):
+        """Stop the current reader thread and release it once it has finished"""
+        thread = self.serial_thread
+        self.serial_thread = None
+        # Anything it still reads must not reach the display or the log
+        thread.parsed.disconnect(self.process_serial_data)
+        thread.log_line.disconnect(self.queue_log_line)
+        # Hook up the release before stopping, so a finish at any point is not missed.
+        # Until then keep a reference so closeEvent can wait for it.
+        self._retired_threads.append(thread)
+        thread.finished.connect(self._reap_serial_threads)
+        thread.finished.connect(thread.deleteLater)
+        thread.stop()
+        # The 50 ms read timeout means a healthy reader exits well within this;
+        # one still opening the port is left to finish on its own
+        thread.wait(500)
             
-        # Parse detection data
-        if "Presence:" in line:
-            self.parse_detection(line)
+    def _reap_serial_threads(self):
+        self._retired_threads = [t for t in self._retired_threads if not t.isFinished()]
+            
+    def queue_log_line(self, line):
+        self._log_buffer.append(line)
         
-        # Parse gate energy data
-        if "GATES_MOV:" in line:
-            self.parse_gate_data(line)
+    def flush_log(self):
+        if self._log_buffer:
+            self.log_text.appendPlainText('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
             
-    def parse_detection(self, line):
-        # Format: "Presence: YES | Stationary: 38cm E:100 | Moving: 30cm E:100"
-        self.current_data['presence'] = 'YES' in line
-        
-        # Parse stationary
-        stat_match = re.search(r'Stationary:\s*(\d+)cm\s*E:(\d+)', line)
-        if stat_match:
-            self.current_data['stat_dist'] = int(stat_match.group(1))
-            self.current_data['stat_energy'] = int(stat_match.group(2))
-        else:
-            self.current_data['stat_dist'] = 0
-            self.current_data['stat_energy'] = 0
+    def process_serial_data(self, msg):
+        # Parsing already happened on the serial thread; just dispatch by type
+        self._handlers[msg['type']](msg)
+        
+    def handle_config(self, msg):
+        self.config_data[msg['key']] = msg['value']
+        # The sensor dumps its config lines back-to-back; rebuild once per tick
+        self._config_dirty = True
             
-        # Parse moving
-        mov_match = re.search(r'Moving:\s*(\d+)cm\s*E:(\d+)', line)
-        if mov_match:
-            self.current_data['mov_dist'] = int(mov_match.group(1))
-            self.current_data['mov_energy'] = int(mov_match.group(2))
-        else:
-            self.current_data['mov_dist'] = 0
-            self.current_data['mov_energy'] = 0
-            
-        self.update_display()
+    def handle_detection(self, msg):
+        self.current_data['presence'] = msg['presence']
+        self.current_data['stat_dist'] = msg['stat_dist']
+        self.current_data['stat_energy'] = msg['stat_energy']
+        self.current_data['mov_dist'] = msg['mov_dist']
+        self.current_data['mov_energy'] = msg['mov_energy']
+        self._dirty = True
     
-    def parse_gate_data(self, line):
-        # Format: "GATES_MOV:0,1,2,3,4,5,6,7,8 | GATES_STAT:0,1,2,3,4,5,6,7,8"
-        mov_match = re.search(r'GATES_MOV:([\d,]+)', line)
-        stat_match = re.search(r'GATES_STAT:([\d,]+)', line)
-        
-        if mov_match:
-            mov_values = [int(x) for x in mov_match.group(1).split(',')]
-            if len(mov_values) == 9:
-                self.gate_data['moving'] = mov_values
-                
-        if stat_match:
-            stat_values = [int(x) for x in stat_match.group(1).split(',')]
-            if len(stat_values) == 9:
-                self.gate_data['stationary'] = stat_values
-        
-        # Update gate visualization
-        self.gate_widget.update_data(self.gate_data['moving'], self.gate_data['stationary'])
+    def handle_gate_data(self, msg):
+        if msg['moving'] is not None:
+            self.gate_data['moving'][:] = msg['moving']
+        if msg['stationary'] is not None:
+            self.gate_data['stationary'][:] = msg['stationary']
+        self._gates_dirty = True
+        
+    def _flush_state(self):
+        if self._dirty:
+            self._dirty = False
+            self.update_display()
+        if self._gates_dirty:
+            self._gates_dirty = False
+            # Gate arrays are shared with the widget, so just schedule a repaint
+            self.gate_widget.update()
+        if self._config_dirty:
+            self._config_dirty = False
+            self.update_config_display()
         
     def update_display(self):
         # Update radar visualization
@@ -518,38 +868,47 @@ class RadarMonitor(QMainWindow):
             self.current_data['mov_energy']
         )
         
-        # Update text labels
-        if self.current_data['presence']:
-            self.presence_label.setText("TARGET DETECTED")
-            self.presence_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: green;")
-        else:
-            self.presence_label.setText("NO TARGET")
-            self.presence_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: gray;")
-            
-        self.stat_dist_label.setText(f"{self.current_data['stat_dist']} cm")
-        self.stat_energy_label.setText(str(self.current_data['stat_energy']))
-        self.mov_dist_label.setText(f"{self.current_data['mov_dist']} cm")
-        self.mov_energy_label.setText(str(self.current_data['mov_energy']))
+        # Update text labels (setText/setStyleSheet only when the value changed)
+        last = self._last_shown
+        presence = self.current_data['presence']
+        if last.get('presence') != presence:
+            last['presence'] = presence
+            if presence:
+                self.presence_label.setText("TARGET DETECTED")
+                self.presence_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: green;")
+            else:
+                self.presence_label.setText("NO TARGET")
+                self.presence_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: gray;")
+        
+        stat_dist = self.current_data['stat_dist']
+        if last.get('stat_dist') != stat_dist:
+            last['stat_dist'] = stat_dist
+            self.stat_dist_label.setText(f"{stat_dist} cm")
+        stat_energy = self.current_data['stat_energy']
+        if last.get('stat_energy') != stat_energy:
+            last['stat_energy'] = stat_energy
+            self.stat_energy_label.setText(str(stat_energy))
+        mov_dist = self.current_data['mov_dist']
+        if last.get('mov_dist') != mov_dist:
+            last['mov_dist'] = mov_dist
+            self.mov_dist_label.setText(f"{mov_dist} cm")
+        mov_energy = self.current_data['mov_energy']
+        if last.get('mov_energy') != mov_energy:
+            last['mov_energy'] = mov_energy
+            self.mov_energy_label.setText(str(mov_energy))
         
     def update_config_display(self):
-        config_text = "SENSOR CONFIGURATION\n" + "="*40 + "\n"
-        if 'firmware' in self.config_data:
-            config_text += f"Firmware: {self.config_data['firmware']}\n"
-        if 'max_gate' in self.config_data:
-            config_text += f"Max Gate: {self.config_data['max_gate']}\n"
-        if 'max_moving_gate' in self.config_data:
-            config_text += f"Max Moving Gate: {self.config_data['max_moving_gate']}\n"
-        if 'max_stationary_gate' in self.config_data:
-            config_text += f"Max Stationary Gate: {self.config_data['max_stationary_gate']}\n"
-        if 'idle_time' in self.config_data:
-            config_text += f"Idle Time: {self.config_data['idle_time']} seconds\n"
-            
-        self.config_text.setText(config_text)
+        template = _CONFIG_HEADER + ''.join(
+            line for key, line in _CONFIG_DISPLAY_LINES if key in self.config_data)
+        self.config_text.setText(template.format_map(self.config_data))
         
     def closeEvent(self, event):
-        if self.serial_thread and self.serial_thread.running:
+        if self.serial_thread:
             self.serial_thread.stop()
             self.serial_thread.wait()
+        for thread in self._retired_threads:
+            thread.stop()
+            thread.wait()
         event.accept()
 
 
@@ -5,24 +5,84 @@ Modern UI with line graphs using pyqtgraph
 
 import sys
 import re
+import time
 import serial
 import serial.tools.list_ports
-from collections import deque
-from datetime import datetime
 import numpy as np
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QLabel, QComboBox, QPushButton, 
-                              QTextEdit, QGroupBox, QGridLayout, QSplitter)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QBrush, QPainterPath
+                              QPlainTextEdit, QGroupBox, QGridLayout, QSplitter)
+from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QRect
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QBrush, QPainterPath, QPixmap
 import pyqtgraph as pg
 import math
 
 
+# Precompiled line patterns (compiled once instead of per incoming line)
+_STAT_RE = re.compile(r'Stationary:\s*(\d+)cm\s*E:(\d+)')
+_MOV_RE = re.compile(r'Moving:\s*(\d+)cm\s*E:(\d+)')
+_GATE_KV_RE = re.compile(r'Gate\s+(\d+):\s*(\d+)')
+# Format: "SENSITIVITY_MOTION:0:36" or "SENSITIVITY_STATIC:0:0"
+_SENSITIVITY_RE = re.compile(r'^SENSITIVITY_(MOTION|STATIC):(\d+):(\d+)$')
+# Substrings that get an unhandled line into the log
+_LOG_MARKERS = ("GATES_", "Version:", "Max gate:", "Motion:", "Stationary:")
+
+# Radar arc trig tables: (sin, cos) per angle line, and (cos, sin) for range labels at 60°
+_ANGLE_SC = tuple((math.sin(math.radians(a)), math.cos(math.radians(a))) for a in (-60, -30, 0, 30, 60))
+_LABEL_SC = (math.cos(math.radians(60)), math.sin(math.radians(60)))
+
+
+def _parse_detection(line):
+    # Format: "Presence: YES | Stationary: 38cm E:100 | Moving: 30cm E:100"
+    stat_match = _STAT_RE.search(line)
+    mov_match = _MOV_RE.search(line)
+    return ('det', 'YES' in line,
+            int(stat_match.group(1)) if stat_match else 0,
+            int(mov_match.group(1)) if mov_match else 0)
+
+
+def _parse_csv9(csv):
+    """Parse a 9-gate CSV field in C; None unless it holds exactly 9 values"""
+    # No count=9: numpy pads a short field with uninitialised values instead of failing
+    try:
+        values = np.fromstring(csv, dtype=np.int16, sep=',')
+    except ValueError:
+        # Unmatched data ("1,,2", "8x"); partition() lets any non-space byte through
+        return None
+    return values if len(values) == 9 else None
+
+
+def _parse_gates(line):
+    # Format: "GATES_MOV:0,1,2,3,4,5,6,7,8 | GATES_STAT:0,1,2,3,4,5,6,7,8"
+    # Slice out each CSV field with partition, no regex needed
+    return ('gates',
+            _parse_csv9(line.partition("GATES_MOV:")[2].partition(" ")[0]),
+            _parse_csv9(line.partition("GATES_STAT:")[2].partition(" ")[0]))
+
+
+def _parse_sensitivity(line):
+    # Format: "SENSITIVITY_MOTION:0:36" or "SENSITIVITY_STATIC:0:0"
+    match = _SENSITIVITY_RE.match(line)
+    if match:
+        gate = int(match.group(2))
+        if gate < 9:
+            return ('sens', match.group(1) == "MOTION", gate, int(match.group(3)))
+    return None
+
+
+# Line prefix -> (parser, log the line?), checked in order. Parsers return a
+# (kind, *values) frame for RadarMonitor._handlers, or None to drop the line.
+_LINE_PARSERS = (
+    ("Presence:", _parse_detection, True),
+    ("GATES_MOV:", _parse_gates, True),
+    ("SENSITIVITY_", _parse_sensitivity, False),
+)
+
+
 class SerialReader(QThread):
-    """Thread for reading serial data"""
-    data_received = pyqtSignal(str)
+    """Thread for reading and parsing serial data, emitted as batches of frames"""
+    parsed = pyqtSignal(list)
     
     def __init__(self, port, baudrate=115200):
         super().__init__()
@@ -30,27 +90,88 @@ class SerialReader(QThread):
         self.baudrate = baudrate
         self.running = False
         self.serial_conn = None
+        self._rx_buf = bytearray()
+        # Inside an old-style sensitivity dump: True (motion), False (stationary) or None
+        self._legacy_motion = None
         
     def run(self):
         try:
             self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=1)
-            self.running = True
-            
+        except Exception as e:
+            self.parsed.emit([('log', f"Serial error: {e}")])
+            return
+        self.running = True
+        
+        try:
             # Request configuration immediately on connect
-            import time
             time.sleep(0.5)  # Wait for ESP32 to be ready
             self.serial_conn.write(b"GET_CONFIG\n")
             
             while self.running:
-                if self.serial_conn.in_waiting:
-                    try:
-                        line = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
-                        if line:
-                            self.data_received.emit(line)
-                    except Exception as e:
-                        self.data_received.emit(f"Read error: {e}")
+                # Blocks for the first byte (up to the 1 s timeout), then drains the rest.
+                # Port-level failures (e.g. the cable was unplugged) end the loop below.
+                chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+                if not chunk:
+                    continue
+                self._rx_buf.extend(chunk)
+                
+                # Split off complete lines; a trailing partial line stays buffered
+                end = self._rx_buf.rfind(b'\n')
+                if end < 0:
+                    continue
+                complete = self._rx_buf[:end]
+                del self._rx_buf[:end + 1]
+                try:
+                    frames = self._parse_lines(
+                        raw.decode('utf-8', errors='ignore').strip()
+                        for raw in complete.split(b'\n'))
+                except Exception as e:
+                    frames = [('log', f"Read error: {e}")]
+                # One cross-thread signal per batch instead of per line
+                if frames:
+                    self.parsed.emit(frames)
         except Exception as e:
-            self.data_received.emit(f"Serial error: {e}")
+            # stop() closes the port under a blocked read; that is not an error
+            if self.running:
+                self.parsed.emit([('log', f"Serial error: {e}")])
+        finally:
+            self.running = False
+            if self.serial_conn.is_open:
+                self.serial_conn.close()
+            
+    def _parse_lines(self, lines):
+        """Parse decoded lines into data frames plus ('log', line) frames for the log view"""
+        frames = []
+        for line in lines:
+            if not line:
+                continue
+            for prefix, parser, log in _LINE_PARSERS:
+                if line.startswith(prefix):
+                    frame = parser(line)
+                    if frame is not None:
+                        frames.append(frame)
+                    if log:
+                        frames.append(('log', line))
+                    break
+            else:
+                # Old-style sensitivity dump: a "Motion Sensitivity" or
+                # "Stationary Sensitivity" header followed by "Gate N: value" lines
+                if "Motion Sensitivity" in line:
+                    self._legacy_motion = True
+                elif "Stationary Sensitivity" in line:
+                    self._legacy_motion = False
+                elif self._legacy_motion is not None and "Gate" in line:
+                    match = _GATE_KV_RE.search(line)
+                    if match:
+                        gate = int(match.group(1))
+                        if gate < 9:
+                            frames.append(('sens', self._legacy_motion, gate, int(match.group(2))))
+                            if gate == 8:
+                                self._legacy_motion = None
+                # Only log important lines to avoid spam
+                if any(x in line for x in _LOG_MARKERS):
+                    frames.append(('log', line))
+        return frames
             
     def stop(self):
         self.running = False
@@ -69,86 +190,163 @@ class RadarArcWidget(QWidget):
         self.setMinimumSize(400, 300)
         self.setSizePolicy(self.sizePolicy().Expanding, self.sizePolicy().Expanding)
         
+        # Static overlay (background, range arcs, labels, angle lines, sensor),
+        # re-rendered only when the widget size or device pixel ratio changes
+        self._bg_cache = None
+        self._bg_size = None
+        # Last complete frame (overlay + targets + status); reused as-is for
+        # repaints Qt requests while the radar state hasn't changed
+        self._frame_cache = None
+        self._frame_dirty = True
+        
+        # Paint objects, created once instead of on every paint
+        self._bg_color = QColor(25, 25, 35)
+        self._grid_pen = QPen(QColor(60, 60, 80), 1)
+        self._range_label_pen = QPen(QColor(100, 100, 120))
+        self._sensor_brush = QBrush(QColor(0, 200, 0))
+        self._stat_pen = QPen(QColor(100, 150, 255), 4)
+        self._mov_pen = QPen(QColor(255, 100, 100), 4)
+        self._detected_pen = QPen(QColor(0, 255, 0))
+        self._idle_pen = QPen(QColor(100, 100, 100))
+        self._small_font = QFont('Arial', 8)
+        self._label_font = QFont('Arial', 9, QFont.Bold)
+        self._status_font = QFont('Arial', 11, QFont.Bold)
+        
     def update_data(self, presence, stat_dist, mov_dist):
+        if (presence, stat_dist, mov_dist) == (self.presence, self.stationary_distance, self.moving_distance):
+            return
+        # Layout (origin/scale) is unknown until the first paint after a resize
+        old_rect = self._target_rect() if self._bg_size is not None else None
         self.presence = presence
         self.stationary_distance = stat_dist
         self.moving_distance = mov_dist
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
-        
+        self._frame_dirty = True
+        if old_rect is None:
+            self.update()
+        else:
+            # Status/label rows plus the old and new target arcs
+            self.update(QRect(0, 0, self.width(), 25).united(old_rect).united(self._target_rect()))
+        
+    def _target_rect(self):
+        # Bounding box of the visible target arcs (upper half of their circles, plus pen width)
+        rect = QRect()
+        if self.presence:
+            for distance in (self.stationary_distance, self.moving_distance):
+                if distance > 0:
+                    radius = int(distance * self._scale)
+                    rect = rect.united(QRect(self._origin_x - radius - 3, self._origin_y - radius - 3,
+                                             radius * 2 + 7, radius // 2 + 7))
+        return rect
+        
+    def resizeEvent(self, event):
+        self._bg_size = None
+        self._frame_dirty = True
+        super().resizeEvent(event)
+        
+    def _render_background(self, width, height):
         # Radar origin (bottom center)
-        origin_x = width // 2
-        origin_y = height - 30
+        self._origin_x = width // 2
+        self._origin_y = height - 30
+        origin_x = self._origin_x
+        origin_y = self._origin_y
         
         # Max range in cm (600 cm = 6 meters)
         max_range = 600
-        scale = (height - 60) / max_range
+        self._scale = (height - 60) / max_range
+        
+        # Allocated in device pixels so it stays sharp on high-DPI screens
+        ratio = self.devicePixelRatioF()
+        self._bg_cache = QPixmap(round(width * ratio), round(height * ratio))
+        self._bg_cache.setDevicePixelRatio(ratio)
+        self._bg_size = (width, height, ratio)
+        self._frame_dirty = True
+        painter = QPainter(self._bg_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
         
         # Background
-        painter.fillRect(0, 0, width, height, QColor(25, 25, 35))
+        painter.fillRect(0, 0, width, height, self._bg_color)
         
         # Draw range arcs (every 150cm)
-        painter.setPen(QPen(QColor(60, 60, 80), 1))
+        label_cos, label_sin = _LABEL_SC
+        painter.setPen(self._grid_pen)
         for distance in range(150, max_range + 1, 150):
-            radius = int(distance * scale)
+            radius = int(distance * self._scale)
             painter.drawArc(origin_x - radius, origin_y - radius, 
                           radius * 2, radius * 2, 
                           30 * 16, 120 * 16)
             
             # Distance labels
-            painter.setPen(QColor(100, 100, 120))
-            painter.setFont(QFont('Arial', 8))
-            label_x = origin_x + int(radius * math.cos(math.radians(60)))
-            label_y = origin_y - int(radius * math.sin(math.radians(60)))
+            painter.setPen(self._range_label_pen)
+            painter.setFont(self._small_font)
+            label_x = origin_x + int(radius * label_cos)
+            label_y = origin_y - int(radius * label_sin)
             painter.drawText(label_x + 5, label_y, f"{distance}cm")
-            painter.setPen(QPen(QColor(60, 60, 80), 1))
+            painter.setPen(self._grid_pen)
         
         # Draw angle lines
-        for angle in [-60, -30, 0, 30, 60]:
-            rad = math.radians(angle)
-            end_x = origin_x + int((height - 60) * math.sin(rad))
-            end_y = origin_y - int((height - 60) * math.cos(rad))
+        length = height - 60
+        for s, c in _ANGLE_SC:
+            end_x = origin_x + int(length * s)
+            end_y = origin_y - int(length * c)
             painter.drawLine(origin_x, origin_y, end_x, end_y)
         
+        # Draw sensor at origin
+        painter.setBrush(self._sensor_brush)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(origin_x - 4, origin_y - 4, 8, 8)
+        painter.end()
+        
+    def paintEvent(self, event):
+        width = self.width()
+        height = self.height()
+        if self._bg_size != (width, height, self.devicePixelRatioF()):
+            self._render_background(width, height)
+        if self._frame_dirty or self._frame_cache is None:
+            self._render_frame()
+            self._frame_dirty = False
+        
+        # The painter is already clipped to the exposed region, so only that part is copied
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._frame_cache)
+        painter.end()
+        
+    def _render_frame(self):
+        self._frame_cache = QPixmap(self._bg_cache)
+        painter = QPainter(self._frame_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        origin_x = self._origin_x
+        origin_y = self._origin_y
+        
         # Draw stationary target arc
         if self.presence and self.stationary_distance > 0:
-            radius = int(self.stationary_distance * scale)
-            painter.setPen(QPen(QColor(100, 150, 255), 4))
+            radius = int(self.stationary_distance * self._scale)
+            painter.setPen(self._stat_pen)
             painter.drawArc(origin_x - radius, origin_y - radius,
                            radius * 2, radius * 2,
                            30 * 16, 120 * 16)
             
             # Label
-            painter.setFont(QFont('Arial', 9, QFont.Bold))
+            painter.setFont(self._label_font)
             painter.drawText(origin_x - 60, 20, f"Stationary: {self.stationary_distance}cm")
         
         # Draw moving target arc
         if self.presence and self.moving_distance > 0:
-            radius = int(self.moving_distance * scale)
-            painter.setPen(QPen(QColor(255, 100, 100), 4))
+            radius = int(self.moving_distance * self._scale)
+            painter.setPen(self._mov_pen)
             painter.drawArc(origin_x - radius, origin_y - radius,
                            radius * 2, radius * 2,
                            30 * 16, 120 * 16)
             
             # Label
-            painter.setFont(QFont('Arial', 9, QFont.Bold))
+            painter.setFont(self._label_font)
             painter.drawText(origin_x + 10, 20, f"Moving: {self.moving_distance}cm")
         
-        # Draw sensor at origin
-        painter.setBrush(QBrush(QColor(0, 200, 0)))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(origin_x - 4, origin_y - 4, 8, 8)
-        
         # Status text
-        painter.setPen(QColor(0, 255, 0) if self.presence else QColor(100, 100, 100))
-        painter.setFont(QFont('Arial', 11, QFont.Bold))
+        painter.setPen(self._detected_pen if self.presence else self._idle_pen)
+        painter.setFont(self._status_font)
         painter.drawText(10, 20, "DETECTED" if self.presence else "NO TARGET")
+        painter.end()
 
 
 class RadarMonitor(QMainWindow):
@@ -157,22 +355,40 @@ class RadarMonitor(QMainWindow):
         self.serial_thread = None
         
         # Data buffers for time plots (120 seconds at ~2 updates/sec = 240 points)
+        # One preallocated ring buffer, a row per series (elapsed time, stationary,
+        # moving, photosensitive): _ts_head is the next write column, _ts_count the fill level
         self.max_history = 240
-        self.time_data = deque(maxlen=self.max_history)
-        self.detection_stat_data = deque(maxlen=self.max_history)
-        self.detection_mov_data = deque(maxlen=self.max_history)
-        self.photosensitive_data = deque(maxlen=self.max_history)
-        self.start_time = datetime.now()
-        
-        # Current data
-        self.moving_energy = [0] * 9
-        self.stationary_energy = [0] * 9
+        self._ts = np.empty((4, self.max_history), dtype=np.float32)
+        self._ts_head = 0
+        self._ts_count = 0
+        self._t0 = time.monotonic()
+        
+        # Current data (gate x-axis: 0, 75, ... 600 cm)
+        self._gate_x = np.arange(9, dtype=np.float32) * 75.0
+        self.moving_energy = np.zeros(9, dtype=np.int16)
+        self.stationary_energy = np.zeros(9, dtype=np.int16)
         self.moving_sensitivity = [0] * 9
         self.stationary_sensitivity = [0] * 9
         self.current_presence = False
         self.current_stat_dist = 0
         self.current_mov_dist = 0
         
+        # Set by the handle_* methods, consumed by the periodic _flush. The gate
+        # curves start dirty so the zero baselines are drawn even if the sensor
+        # only ever reports zeros (unchanged data never sets them again).
+        self._need_arc = False
+        self._need_range = False
+        self._need_gates = True
+        self._need_sensitivity = True
+        self._sensitivity_changed = False
+        
+        # Frame kind -> handler; frames arrive already parsed from SerialReader
+        self._handlers = {
+            'det': self.handle_detection,
+            'gates': self.handle_gate_data,
+            'sens': self.handle_sensitivity,
+        }
+        
         self.init_ui()
         
     def init_ui(self):
@@ -262,6 +478,9 @@ class RadarMonitor(QMainWindow):
         self.range_plot.setLabel('bottom', 'Time', units='s')
         self.range_plot.showGrid(x=True, y=True, alpha=0.3)
         self.range_plot.enableAutoRange(axis='y')
+        # Only hand visible, peak-downsampled samples to the painter
+        self.range_plot.setDownsampling(auto=True, mode='peak')
+        self.range_plot.setClipToView(True)
         self.range_stat_curve = self.range_plot.plot(pen=pg.mkPen(color=(100, 150, 255), width=2), name='Stationary')
         self.range_mov_curve = self.range_plot.plot(pen=pg.mkPen(color=(255, 100, 100), width=2), name='Moving')
         self.range_plot.addLegend()
@@ -273,6 +492,8 @@ class RadarMonitor(QMainWindow):
         self.photo_plot.setLabel('bottom', 'Time', units='s')
         self.photo_plot.showGrid(x=True, y=True, alpha=0.3)
         self.photo_plot.setYRange(-10, 270)  # Start with reasonable range for 0-255 values
+        self.photo_plot.setDownsampling(auto=True, mode='peak')
+        self.photo_plot.setClipToView(True)
         self.photo_curve = self.photo_plot.plot(pen=pg.mkPen(color=(150, 255, 150), width=2))
         graphs_layout.addWidget(self.photo_plot, 1, 1)
         
@@ -306,9 +527,11 @@ class RadarMonitor(QMainWindow):
         log_group = QGroupBox("Data Log")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(400)
+        self.log_text.setMaximumBlockCount(500)
+        self.log_text.setCenterOnScroll(False)
         log_layout.addWidget(self.log_text)
         
         clear_btn = QPushButton("Clear Log")
@@ -325,6 +548,11 @@ class RadarMonitor(QMainWindow):
         
         main_layout.addWidget(content_splitter)
         
+        # Parsers only record state; widgets and curves are refreshed once per tick
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.timeout.connect(self._flush)
+        self._repaint_timer.start(100)
+        
     def refresh_ports(self):
         self.port_combo.clear()
         ports = serial.tools.list_ports.comports()
@@ -337,90 +565,72 @@ class RadarMonitor(QMainWindow):
             if port_text:
                 port = port_text.split(' - ')[0]
                 self.serial_thread = SerialReader(port)
-                self.serial_thread.data_received.connect(self.process_serial_data)
+                self.serial_thread.parsed.connect(self.process_serial_data)
                 self.serial_thread.start()
                 self.connect_btn.setText("Disconnect")
-                self.log_text.append(f"Connected to {port}")
-                self.start_time = datetime.now()
+                self.log_text.appendPlainText(f"Connected to {port}")
+                self._t0 = time.monotonic()
         else:
             self.serial_thread.stop()
             self.serial_thread.wait()
             self.connect_btn.setText("Connect")
-            self.log_text.append("Disconnected")
-            
-    def process_serial_data(self, line):
-        # Only log important lines to avoid spam
-        if any(x in line for x in ["Presence:", "GATES_", "Version:", "Max gate:", "Motion:", "Stationary:"]):
-            self.log_text.append(line)
-            # Auto-scroll and limit
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.End)
-            self.log_text.setTextCursor(cursor)
+            self.log_text.appendPlainText("Disconnected")
             
-            # Limit log size
-            if self.log_text.document().blockCount() > 500:
-                cursor.movePosition(cursor.Start)
-                cursor.movePosition(cursor.Down, cursor.KeepAnchor, 100)
-                cursor.removeSelectedText()
-        
-        # Parse detection data
-        if "Presence:" in line:
-            self.parse_detection(line)
-        
-        # Parse gate energy data
-        if "GATES_MOV:" in line:
-            self.parse_gate_data(line)
-        
-        # Parse sensitivity configuration
-        if "SENSITIVITY_" in line or "Gate" in line or "Sensitivity" in line:
-            self.parse_sensitivity(line)
+    def process_serial_data(self, frames):
+        # Parsing already happened on the serial thread; just dispatch by kind
+        logged = []
+        for frame in frames:
+            kind = frame[0]
+            if kind == 'log':
+                logged.append(frame[1])
+            else:
+                self._handlers[kind](*frame[1:])
+        
+        if logged:
+            # One append per batch; the document trims itself to 500 blocks
+            self.log_text.setUpdatesEnabled(False)
+            self.log_text.appendPlainText("\n".join(logged))
+            self.log_text.setUpdatesEnabled(True)
             
-    def parse_detection(self, line):
-        # Format: "Presence: YES | Stationary: 38cm E:100 | Moving: 30cm E:100"
-        self.current_presence = 'YES' in line
-        
-        # Parse stationary
-        stat_match = re.search(r'Stationary:\s*(\d+)cm\s*E:(\d+)', line)
-        if stat_match:
-            self.current_stat_dist = int(stat_match.group(1))
-        else:
-            self.current_stat_dist = 0
-            
-        # Parse moving
-        mov_match = re.search(r'Moving:\s*(\d+)cm\s*E:(\d+)', line)
-        if mov_match:
-            self.current_mov_dist = int(mov_match.group(1))
-        else:
-            self.current_mov_dist = 0
-        # Update time plot data
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        self.time_data.append(elapsed)
-        
-        # Store stationary and moving distances separately
-        self.detection_stat_data.append(self.current_stat_dist)
-        self.detection_mov_data.append(self.current_mov_dist)
-        
-        # Photosensitive placeholder (0 for now)
-        self.photosensitive_data.append(0)
-        
-        self.update_displays()
+    def handle_detection(self, presence, stat_dist, mov_dist):
+        self.current_presence = presence
+        self.current_stat_dist = stat_dist
+        self.current_mov_dist = mov_dist
+        
+        # Update time plot data: elapsed time, stationary and moving distances,
+        # photosensitive placeholder (0 for now)
+        head = self._ts_head
+        self._ts[:, head] = (time.monotonic() - self._t0, stat_dist, mov_dist, 0)
+        
+        self._ts_head = (head + 1) % self.max_history
+        if self._ts_count < self.max_history:
+            self._ts_count += 1
+        
+        self._need_arc = True
+        self._need_range = True
     
-    def parse_gate_data(self, line):
-        # Format: "GATES_MOV:0,1,2,3,4,5,6,7,8 | GATES_STAT:0,1,2,3,4,5,6,7,8"
-        mov_match = re.search(r'GATES_MOV:([\d,]+)', line)
-        stat_match = re.search(r'GATES_STAT:([\d,]+)', line)
-        
-        if mov_match:
-            mov_values = [int(x) for x in mov_match.group(1).split(',')]
-            if len(mov_values) == 9:
-                self.moving_energy = mov_values
-                
-        if stat_match:
-            stat_values = [int(x) for x in stat_match.group(1).split(',')]
-            if len(stat_values) == 9:
-                self.stationary_energy = stat_values
-        
-        self.update_gate_plots()
+    def handle_gate_data(self, mov_values, stat_values):
+        # A still target repeats identical frames; skip the curve rebuild for those
+        if mov_values is not None and not np.array_equal(mov_values, self.moving_energy):
+            self.moving_energy[:] = mov_values
+            self._need_gates = True
+        if stat_values is not None and not np.array_equal(stat_values, self.stationary_energy):
+            self.stationary_energy[:] = stat_values
+            self._need_gates = True
+        
+    def _flush(self):
+        if self._need_arc:
+            self._need_arc = False
+            self.update_displays()
+        if self._need_range:
+            self._need_range = False
+            self.update_time_plots()
+        if self._need_gates:
+            self._need_gates = False
+            self.update_gate_plots()
+        if self._need_sensitivity:
+            self._need_sensitivity = False
+            self.update_sensitivity_plots()
         
     def update_displays(self):
         # Update radar arc
@@ -437,81 +647,45 @@ class RadarMonitor(QMainWindow):
         self.stat_label.setText(f"{self.current_stat_dist} cm" if self.current_stat_dist > 0 else "--")
         self.mov_label.setText(f"{self.current_mov_dist} cm" if self.current_mov_dist > 0 else "--")
         
-        # Update time plots
-        if len(self.time_data) > 0:
-            times = np.array(self.time_data)
+    def update_time_plots(self):
+        if self._ts_count > 0:
+            times, stat, mov, photo = self._history()
             
             # Detection range plot (separate curves for stationary and moving)
-            self.range_stat_curve.setData(times, np.array(self.detection_stat_data))
-            self.range_mov_curve.setData(times, np.array(self.detection_mov_data))
+            self.range_stat_curve.setData(times, stat)
+            self.range_mov_curve.setData(times, mov)
             
             # Photosensitive plot
-            self.photo_curve.setData(times, self.photosensitive_data)
+            self.photo_curve.setData(times, photo)
             
-    def parse_sensitivity(self, line):
-        # Parse new format: "SENSITIVITY_MOTION:0:36" or "SENSITIVITY_STATIC:0:0"
-        if line.startswith("SENSITIVITY_MOTION:"):
-            parts = line.split(":")
-            if len(parts) == 3:
-                gate = int(parts[1])
-                value = int(parts[2])
-                if gate < 9:
-                    self.moving_sensitivity[gate] = value
-                    if gate == 8:
-                        self.update_sensitivity_plots()
-        elif line.startswith("SENSITIVITY_STATIC:"):
-            parts = line.split(":")
-            if len(parts) == 3:
-                gate = int(parts[1])
-                value = int(parts[2])
-                if gate < 9:
-                    self.stationary_sensitivity[gate] = value
-                    if gate == 8:
-                        self.update_sensitivity_plots()
-        
-        # Also parse old motion/stationary sensitivity format for backward compat
-        elif "Gate" in line and ":" in line:
-            match = re.search(r'Gate\s+(\d+):\s*(\d+)', line)
-            if match:
-                gate = int(match.group(1))
-                value = int(match.group(2))
-                if gate < 9:
-                    if hasattr(self, '_parsing_motion_sensitivity') and self._parsing_motion_sensitivity:
-                        self.moving_sensitivity[gate] = value
-                        if gate == 8:
-                            self._parsing_motion_sensitivity = False
-                            self.update_sensitivity_plots()
-                    elif hasattr(self, '_parsing_stationary_sensitivity') and self._parsing_stationary_sensitivity:
-                        self.stationary_sensitivity[gate] = value
-                        if gate == 8:
-                            self._parsing_stationary_sensitivity = False
-                            self.update_sensitivity_plots()
-        
-        # Set flags when we see the headers
-        if "Motion Sensitivity" in line:
-            self._parsing_motion_sensitivity = True
-            self._parsing_stationary_sensitivity = False
-        elif "Stationary Sensitivity" in line:
-            self._parsing_motion_sensitivity = False
-            self._parsing_stationary_sensitivity = True
+    def _history(self):
+        """Return the time-series block oldest-first (a view unless it has wrapped)"""
+        head = self._ts_head
+        if self._ts_count < self.max_history or head == 0:
+            return self._ts[:, :self._ts_count]
+        return np.concatenate((self._ts[:, head:], self._ts[:, :head]), axis=1)
+            
+    def handle_sensitivity(self, motion, gate, value):
+        values = self.moving_sensitivity if motion else self.stationary_sensitivity
+        if values[gate] != value:
+            values[gate] = value
+            self._sensitivity_changed = True
+        # Gates arrive in order; redraw once the last one is in, if anything moved
+        if gate == 8 and self._sensitivity_changed:
+            self._sensitivity_changed = False
+            self._need_sensitivity = True
     
     def update_sensitivity_plots(self):
-        # X-axis: gate distances (0, 75, 150, 225, 300, 375, 450, 525, 600 cm)
-        x = np.array([i * 75 for i in range(9)])
-        
         # Update moving sensitivity baseline (gray dashed line)
-        self.moving_sensitivity_curve.setData(x, self.moving_sensitivity)
+        self.moving_sensitivity_curve.setData(self._gate_x, self.moving_sensitivity)
         
         # Update stationary sensitivity baseline (gray dashed line)
-        self.static_sensitivity_curve.setData(x, self.stationary_sensitivity)
+        self.static_sensitivity_curve.setData(self._gate_x, self.stationary_sensitivity)
     
     def update_gate_plots(self):
-        # X-axis: gate distances
-        x = np.array([i * 75 for i in range(9)])
-        
         # Update real-time energy (colored solid lines)
-        self.moving_energy_curve.setData(x, self.moving_energy)
-        self.static_energy_curve.setData(x, self.stationary_energy)
+        self.moving_energy_curve.setData(self._gate_x, self.moving_energy)
+        self.static_energy_curve.setData(self._gate_x, self.stationary_energy)
         
     def closeEvent(self, event):
         if self.serial_thread and self.serial_thread.running:
@@ -562,7 +736,7 @@ if __name__ == '__main__':
             padding: 3px;
             color: #e0e0e0;
         }
-        QTextEdit {
+        QPlainTextEdit {
             background-color: #1e1e28;
             border: 1px solid #3c3c50;
             border-radius: 3px;